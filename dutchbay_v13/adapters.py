@@ -1,9 +1,23 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
-# Core finance primitives live in finance/*
-from .finance.irr import irr, npv
-from .finance.debt import apply_debt_layer
+from .finance.utils import as_float as _as_float
+
+
+# Core finance primitives live in finance/*. They are imported on first use:
+# finance.irr pulls in NumPy/numpy_financial, which paths that only import
+# this module (CLI --help, validation) never need.
+@lru_cache(maxsize=1)
+def _irr_funcs():
+    from .finance.irr import irr, npv
+    return irr, npv
+
+
+@lru_cache(maxsize=1)
+def _apply_debt_layer():
+    from .finance.debt import apply_debt_layer
+    return apply_debt_layer
 
 
 # -----------------------
@@ -18,13 +32,6 @@ def _get(d: Dict[str, Any], path: Iterable[str], default: Any = None) -> Any:
     return cur
 
 
-def _as_float(v: Any, default: Optional[float] = None) -> Optional[float]:
-    try:
-        return float(v) if v is not None else default
-    except Exception:
-        return default
-
-
 # ---------------
 # param utilities
 # ---------------
@@ -75,17 +82,16 @@ def run_irr(params: Dict[str, Any], annual: Optional[List[Dict[str, Any]]] = Non
     years = _lifetime_years(params)
     capex = _capex_usd_total(params)
 
-    # normalize 'annual' rows to the model horizon
-    rows: List[Dict[str, float]] = []
+    # normalize 'annual' CFADS to the model horizon; kept as a flat column and
+    # only turned into per-year dicts for the returned table
+    cfads: List[float] = []
     if annual and isinstance(annual, list):
         for i in range(years):
             r = annual[i] if i < len(annual) else {}
-            cfads = _as_float(r.get("cfads_usd"), 0.0) or 0.0
-            rows.append({"year": float(i + 1), "cfads_usd": float(cfads)})
+            cfads.append(float(_as_float(r.get("cfads_usd"), 0.0) or 0.0))
     else:
         # no builder here; if nothing is given we fall back to zeros to keep function total
-        for i in range(years):
-            rows.append({"year": float(i + 1), "cfads_usd": 0.0})
+        cfads = [0.0] * years
 
     # financing terms (can be under Financing_Terms or financing)
     fin = (params.get("Financing_Terms") or params.get("financing") or {})
@@ -102,9 +108,9 @@ def run_irr(params: Dict[str, Any], annual: Optional[List[Dict[str, Any]]] = Non
     if debt_ratio > 0.0:
         # Let the debt layer do its job (sculpt/annuity, DSRA/guarantees, etc.).
         # Contract: it returns aligned 'equity_cf' and 'debt_service' arrays (length == years).
-        debt_out = apply_debt_layer(
+        debt_out = _apply_debt_layer()(
             params,
-            [{"cfads_usd": r["cfads_usd"]} for r in rows],  # minimal signal needed by the debt layer
+            [{"cfads_usd": c} for c in cfads],  # minimal signal needed by the debt layer
         ) or {}
 
         equity_cf = [float(x) for x in (debt_out.get("equity_cf") or [])]
@@ -115,14 +121,14 @@ def run_irr(params: Dict[str, Any], annual: Optional[List[Dict[str, Any]]] = Non
         # Fallback if the debt layer didn't provide equity_cf but did provide debt_service
         if (not equity_cf) and debt_service:
             equity_cf = [
-                max(0.0, rows[i]["cfads_usd"] - debt_service[i]) for i in range(min(len(rows), len(debt_service)))
+                max(0.0, cfads[i] - debt_service[i]) for i in range(min(len(cfads), len(debt_service)))
             ]
             # pad if needed
             if len(equity_cf) < years:
                 equity_cf.extend([0.0] * (years - len(equity_cf)))
     else:
         # equity-only: equity_CF == CFADS
-        equity_cf = [r["cfads_usd"] for r in rows]
+        equity_cf = list(cfads)
 
     # Ensure alignment
     if len(equity_cf) < years:
@@ -134,7 +140,7 @@ def run_irr(params: Dict[str, Any], annual: Optional[List[Dict[str, Any]]] = Non
     # construct cashflow series
     # --------------------------
     # Project cashflows = [-CAPEX] + [CFADS]
-    project_cfs: List[float] = [-float(capex)] + [float(r["cfads_usd"]) for r in rows]
+    project_cfs: List[float] = [-float(capex)] + cfads
 
     # Equity cashflows = [-EquityContrib] + [equity_CF]
     # Simple approximation: equity injected at t0 equals (1 - debt_ratio) * CAPEX.
@@ -144,17 +150,18 @@ def run_irr(params: Dict[str, Any], annual: Optional[List[Dict[str, Any]]] = Non
     # --------------------------
     # metrics
     # --------------------------
+    irr, npv = _irr_funcs()
     eq_irr = irr(equity_cfs)
     pr_irr = irr(project_cfs)
     discount = _as_float(_get(params, ["metrics", "npv_discount_rate"]), 0.12) or 0.12
     pv_12 = npv(float(discount), project_cfs)
 
     # ship a normalized annual table (always includes equity_cf)
-    annual_out = []
-    for i, r in enumerate(rows):
-        row = dict(r)
-        row["equity_cf"] = float(equity_cf[i]) if i < len(equity_cf) else 0.0
-        annual_out.append(row)
+    # (equity_cf is already aligned to the horizon above)
+    annual_out = [
+        {"year": float(i + 1), "cfads_usd": cfads[i], "equity_cf": float(equity_cf[i])}
+        for i in range(years)
+    ]
 
     return {
         "equity_irr": eq_irr,
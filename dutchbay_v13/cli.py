@@ -6,7 +6,8 @@ import os
 import sys
 from pathlib import Path
 
-from .scenario_runner import run_dir  # run_dir(config, out_dir, mode, fmt, save_annual=False, require_annual=False)
+# Built on first use and reused across main() calls.
+_PARSER: argparse.ArgumentParser | None = None
 
 
 def _fmt_pct(x):
@@ -20,7 +21,10 @@ def _fmt_musd(x):
         return "n/a"
 
 
-def main(argv: list[str] | None = None) -> int:
+def _build_parser() -> argparse.ArgumentParser:
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
     parser = argparse.ArgumentParser(
         prog="dutchbay_v13",
         description=(
@@ -47,7 +51,12 @@ def main(argv: list[str] | None = None) -> int:
     mode_group.add_argument("--strict", action="store_true", help="Force strict validation (VALIDATION_MODE=strict).")
     mode_group.add_argument("--relaxed", action="store_true", help="Force relaxed validation (unset VALIDATION_MODE).")
 
-    args = parser.parse_args(argv)
+    _PARSER = parser
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     # Wire VALIDATION_MODE according to flags
     if args.strict:
@@ -60,7 +69,9 @@ def main(argv: list[str] | None = None) -> int:
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Delegate
+    # Delegate (imported here so --help does not pay for the model stack)
+    from .scenario_runner import run_dir  # run_dir(config, out_dir, mode, fmt, save_annual=False, require_annual=False)
+
     res = run_dir(
         config_path,
         out_dir,
@@ -71,13 +82,16 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     summary = res.summary  # dict
-    print("\n--- IRR / NPV / DSCR RESULTS ---")
-    print(f"Equity IRR:   {_fmt_pct(summary.get('equity_irr'))}")
-    print(f"Project IRR:  {_fmt_pct(summary.get('project_irr'))}")
-    print(f"NPV @ 12%:    {_fmt_musd(summary.get('npv_12'))}")
-
+    lines = [
+        "\n--- IRR / NPV / DSCR RESULTS ---",
+        f"Equity IRR:   {_fmt_pct(summary.get('equity_irr'))}",
+        f"Project IRR:  {_fmt_pct(summary.get('project_irr'))}",
+        f"NPV @ 12%:    {_fmt_musd(summary.get('npv_12'))}",
+    ]
     if res.results_path:
-        print(str(res.results_path))
+        lines.append(str(res.results_path))
+    # one write instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
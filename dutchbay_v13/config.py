@@ -3,8 +3,15 @@ from __future__ import annotations
 from typing import Any, Dict, Tuple
 import os
 import io
+import re
 import yaml
 
+from .parse_cache import load_cached
+from .yaml_compat import SafeLoader
+
+# Values that could be numbers start with a digit or ".digit" (after sign).
+_NUM_PREFIX = re.compile(r"\s*[+-]?\.?\d")
+
 
 def _parse_yaml_fallback(text: str) -> Dict[str, Any]:
     """
@@ -21,12 +28,16 @@ def _parse_yaml_fallback(text: str) -> Dict[str, Any]:
         k, v = line.split(":", 1)
         k = k.strip()
         v = v.strip().strip('"').strip("'")
-        try:
-            if v.lower() in ("true", "false"):
-                data[k] = v.lower() == "true"
-            else:
+        lv = v.lower()
+        if lv in ("true", "false"):
+            data[k] = lv == "true"
+        elif _NUM_PREFIX.match(v):
+            try:
                 data[k] = float(v) if "." in v else int(v)
-        except Exception:
+            except ValueError:
+                data[k] = v
+        else:
+            # cannot parse as int/float; skip the exception path entirely
             data[k] = v
     return data
 
@@ -45,8 +56,41 @@ def _flatten_grouped(cfg: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _split_power_and_debt(d: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    debt = d.pop("debt", {}) if isinstance(d, dict) else {}
-    return d, debt
+    # d is always the dict from _flatten_grouped; a missing or non-mapping
+    # "debt" entry (e.g. a bare "debt:" line) yields an empty section.
+    debt = d.pop("debt", None)
+    return d, debt if isinstance(debt, dict) else {}
+
+
+def _parse_yaml_text(text: str) -> Dict[str, Any]:
+    try:
+        cfg = yaml.load(text, Loader=SafeLoader) or {}
+        return cfg if isinstance(cfg, dict) else {}
+    except Exception:
+        return _parse_yaml_fallback(text)
+
+
+def _read_yaml(p: str) -> Any:
+    with open(p, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_yaml_cached(p: str) -> Any:
+    """
+    Parse a YAML file, streaming the handle straight into the loader.
+    Results come from the shared parse cache; callers get a private copy.
+    Raises on unreadable files or YAML errors (nothing is cached then).
+    """
+    return load_cached(p, _read_yaml)
+
+
+def _parse_yaml_path(p: str) -> Dict[str, Any]:
+    try:
+        cfg = _load_yaml_cached(p) or {}
+        return cfg if isinstance(cfg, dict) else {}
+    except yaml.YAMLError:
+        with open(p, "r", encoding="utf-8") as f:
+            return _parse_yaml_fallback(f.read())
 
 
 def load_model_config(
@@ -56,20 +100,10 @@ def load_model_config(
     Load YAML from a path or text stream. If YAML fails, use a tolerant fallback.
     Returns (flat_config, debt_section).
     """
-    text: str
     if hasattr(source, "read"):
-        text = str(source.read())
+        cfg = _parse_yaml_text(str(source.read()))
     else:
-        p = os.fspath(source)
-        with open(p, "r", encoding="utf-8") as f:
-            text = f.read()
-
-    try:
-        cfg = yaml.safe_load(text) or {}
-        if not isinstance(cfg, dict):
-            cfg = {}
-    except Exception:
-        cfg = _parse_yaml_fallback(text)
+        cfg = _parse_yaml_path(os.fspath(source))
 
     flat = _flatten_grouped(cfg)
     return _split_power_and_debt(flat)
@@ -80,11 +114,7 @@ def load_config(path_or_dict):
     if isinstance(path_or_dict, dict):
         return dict(path_or_dict)
     try:
-        from pathlib import Path
-        import yaml  # optional; if missing, use a naive parser
-        p = Path(path_or_dict)
-        with p.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml_cached(os.fspath(path_or_dict)) or {}
     except Exception:
         # ultra-naive key: value loader
         data = {}
@@ -35,8 +35,10 @@ def run_epc(
 ) -> int:
     if config is None and config_path is not None:
         import yaml  # type: ignore
+        from .yaml_compat import SafeLoader
 
-        config = yaml.safe_load(Path(config_path).read_text(encoding="utf-8")) or {}
+        with Path(config_path).open("rb") as fh:
+            config = yaml.load(fh, Loader=SafeLoader) or {}
     cfg = config or {}
 
     p = EPCParams(
@@ -1,6 +1,8 @@
 # dutchbay_v13/finance/cashflow.py
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from .utils import as_float as _as_float
 
 HOURS_PER_YEAR = 8760.0
 
@@ -12,30 +14,30 @@ def _get(d: Dict[str, Any], path: List[str], default=None):
         cur = cur[k]
     return cur
 
-def _as_float(x, default=None):
-    try:
-        return float(x) if x is not None else default
-    except Exception:
-        return default
-
 def _int(x, default=0) -> int:
     try:
         return int(x)
     except Exception:
         return default
 
-def _years_total(p: Dict[str, Any]) -> int:
+def _timeline(p: Dict[str, Any]) -> Dict[str, Any]:
+    # project.timeline, walked once; every timeline field is read off this map
+    tl = _get(p, ["project", "timeline"])
+    return tl if isinstance(tl, dict) else {}
+
+def _years_total(p: Dict[str, Any], tl: Optional[Dict[str, Any]] = None) -> int:
     # Prefer explicit ops timeline; else fallback to lifetime_years
-    ops_years = _int(_get(p, ["project", "timeline", "ops_years"]), None)
+    if tl is None:
+        tl = _timeline(p)
+    ops_years = _int(tl.get("ops_years"), None)
     if ops_years is not None:
-        pre = _int(_get(p, ["project", "timeline", "ppa_to_fc_years"]), 0) \
-            + _int(_get(p, ["project", "timeline", "construction_years"]), 0)
-        return pre + ops_years
-    return _int(_get(p, ["project", "timeline", "lifetime_years"]), 20)
+        return _ops_start_index(p, tl) + ops_years
+    return _int(tl.get("lifetime_years"), 20)
 
-def _ops_start_index(p: Dict[str, Any]) -> int:
-    return _int(_get(p, ["project", "timeline", "ppa_to_fc_years"]), 0) \
-         + _int(_get(p, ["project", "timeline", "construction_years"]), 0)
+def _ops_start_index(p: Dict[str, Any], tl: Optional[Dict[str, Any]] = None) -> int:
+    if tl is None:
+        tl = _timeline(p)
+    return _int(tl.get("ppa_to_fc_years"), 0) + _int(tl.get("construction_years"), 0)
 
 def _capacity_mw(p: Dict[str, Any]) -> float:
     v = _get(p, ["project", "capacity_mw"])
@@ -54,11 +56,15 @@ def _loss_factor(p: Dict[str, Any]) -> float:
 def _fx_curve(p: Dict[str, Any], n: int) -> List[float]:
     explicit = _get(p, ["fx", "curve_lkr_per_usd"])
     if isinstance(explicit, list) and explicit:
-        if len(explicit) >= n:
+        if len(explicit) == n:
+            return [float(x) for x in explicit]
+        if len(explicit) > n:
             return [float(x) for x in explicit[:n]]
         return [float(x) for x in explicit] + [float(explicit[-1])] * (n - len(explicit))
     start = _as_float(_get(p, ["fx", "start_lkr_per_usd"]), 300.0) or 300.0
     depr = _as_float(_get(p, ["fx", "annual_depr"]), 0.03) or 0.03
+    # Compounding stays a scalar loop: for 20-30 year horizons it beats
+    # building a NumPy array and converting back to a list.
     out: List[float] = []
     cur = float(start)
     for _ in range(max(1, n)):
@@ -97,43 +103,52 @@ def _tariff_mode(p: Dict[str, Any]) -> str:
         return "USD"
     return "LKR"
 
-def _tariff_usd_per_kwh(p: Dict[str, Any], fx: List[float], t: int) -> float:
+def _tariff_inputs(p: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Resolve (usd_per_kwh, lkr_per_kwh) once; USD wins when both are given."""
     usd = _get(p, ["tariff", "usd_per_kwh"])
     if usd is None:
         usd = _get(p, ["tariff_usd_per_kwh"])
     if usd is not None:
-        return float(usd)
+        return float(usd), None
     lkr = _get(p, ["tariff", "lkr_per_kwh"])
     if lkr is None:
         lkr = _get(p, ["tariff_lkr_per_kwh"])
-    lkr_val = _as_float(lkr, None)
-    if lkr_val is None:
-        return 0.0
-    # unindexed LKR tariff → convert each year at that year's FX
-    return float(lkr_val) / float(fx[t])
+    return None, _as_float(lkr, None)
 
 def _opex_usd_per_year(p: Dict[str, Any]) -> float:
     floor = _as_float(_get(p, ["opex", "floor_usd_per_year"]), 300_000.0) or 300_000.0
     v = _as_float(_get(p, ["opex", "usd_per_year"]), floor) or floor
     return max(v, floor)
 
-def build_annual_rows(p: Dict[str, Any]) -> List[Dict[str, float]]:
-    years = _years_total(p)
-    ops_start = _ops_start_index(p)
+def build_annual_columns(p: Dict[str, Any]) -> Dict[str, List[float]]:
+    """Annual series as columns (year, revenue_usd, opex_usd, cfads_usd)."""
+    tl = _timeline(p)
+    years = _years_total(p, tl)
+    ops_start = _ops_start_index(p, tl)
     fx = _fx_curve(p, years)
     mwh = _energy_series_mwh(p, years, ops_start)
     opex_flat = _opex_usd_per_year(p)
+    tariff_usd_in, tariff_lkr_in = _tariff_inputs(p)
+
+    # Pick the tariff branch once, then build each column in one pass over
+    # the ops years; pre-ops years stay at zero.
+    s = min(ops_start, years)
+    pre = [0.0] * s
+    n_ops = years - s
+    # kWh = MWh*1000 → divide by 1000
+    if tariff_usd_in is not None:
+        revenue = pre + [(m * tariff_usd_in) / 1_000.0 for m in mwh[s:years]]
+    elif tariff_lkr_in is not None:
+        # unindexed LKR tariff → convert each year at that year's FX
+        revenue = pre + [(m * (tariff_lkr_in / x)) / 1_000.0 for m, x in zip(mwh[s:years], fx[s:years])]
+    else:
+        revenue = pre + [0.0] * n_ops
+    opex = pre + [opex_flat] * n_ops
+    cfads = pre + [rv - opex_flat for rv in revenue[s:]]
+    return {"year": list(range(1, years + 1)), "revenue_usd": revenue, "opex_usd": opex, "cfads_usd": cfads}
 
-    rows: List[Dict[str, float]] = []
-    for t in range(years):
-        if t < ops_start:
-            rows.append({"year": t+1, "revenue_usd": 0.0, "opex_usd": 0.0, "cfads_usd": 0.0})
-            continue
-        tariff_usd = _tariff_usd_per_kwh(p, fx, t)
-        revenue_usd = (mwh[t] * tariff_usd) / 1_000.0  # kWh = MWh*1000 → divide by 1000
-        opex_usd = opex_flat
-        cfads = revenue_usd - opex_usd
-        rows.append({"year": t+1, "revenue_usd": revenue_usd, "opex_usd": opex_usd, "cfads_usd": cfads})
-    return rows
-
-    
\ No newline at end of file
+def build_annual_rows(p: Dict[str, Any]) -> List[Dict[str, float]]:
+    """Row view of build_annual_columns: one dict per year."""
+    cols = build_annual_columns(p)
+    keys = tuple(cols)
+    return [dict(zip(keys, vals)) for vals in zip(*cols.values())]
@@ -99,13 +99,10 @@ def apply_debt_layer(params: Dict, annual_rows: List[Dict[str, float]]) -> Dict[
     debt_ratio = float(terms.get("debt_ratio", 0.0) or 0.0)
     # passthrough if no debt
     if debt_ratio <= 0:
-        rows = []
-        for r in annual_rows:
-            cf = float(r.get("cfads_usd", 0.0))
-            rr = dict(r)
-            rr["debt_service"] = 0.0
-            rr["equity_cf"] = cf
-            rows.append(rr)
+        rows = [
+            {**r, "debt_service": 0.0, "equity_cf": float(r.get("cfads_usd", 0.0))}
+            for r in annual_rows
+        ]
         return {"annual": rows, "dscr_min": None, "balloon_remaining": 0.0, "debt_service": []}
 
     capex = float((params.get("capex") or {}).get("usd_total", 0.0))
@@ -138,27 +135,26 @@ def apply_debt_layer(params: Dict, annual_rows: List[Dict[str, float]]) -> Dict[
     )
 
     # decorate annual rows with debt_service + equity_cf
+    # (schedule years run 1..len(sched) without gaps, so index by year - 1)
     rows: List[Dict[str, float]] = []
-    by_year = {int(s["year"]): s for s in sched}
+    ds_by_year = [float(s["debt_service"]) for s in sched]
+    n_sched = len(ds_by_year)
     dscr_vals: List[float] = []
     for r in annual_rows:
         y = int(r.get("year", 0))
         cf = float(r.get("cfads_usd", 0.0))
-        ds = float(by_year.get(y, {}).get("debt_service", 0.0))
-        row = dict(r)
-        row["debt_service"] = ds
-        row["equity_cf"] = cf - ds
-        rows.append(row)
+        ds = ds_by_year[y - 1] if 0 < y <= n_sched else 0.0
+        rows.append({**r, "debt_service": ds, "equity_cf": cf - ds})
         if ds > 0:
-            dscr_vals.append(cf / ds if ds else None)
+            dscr_vals.append(cf / ds)
 
-    dscr_min = min(d for d in dscr_vals) if dscr_vals else None
+    dscr_min = min(dscr_vals) if dscr_vals else None
     balloon_remaining = float(sched[-1]["balance"]) if sched else 0.0
     return {
         "annual": rows,
         "dscr_min": dscr_min,
         "balloon_remaining": balloon_remaining,
-        "debt_service": [float(s["debt_service"]) for s in sched],
+        "debt_service": ds_by_year,
     }
 
 __all__ = ["blended_rate", "amortization_schedule", "apply_debt_layer"]
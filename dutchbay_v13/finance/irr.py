@@ -1,7 +1,10 @@
 # dutchbay_v13/finance/irr.py
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+import math
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
 
 # Try numpy-financial if available; otherwise use a robust bracketed solver.
 try:
@@ -19,17 +22,31 @@ def npv(rate: float, cashflows: Iterable[float]) -> float:
     if r <= -1.0:
         # Avoid division by zero / negatives beyond -100%
         r = -0.999999
+    # Horner form, last period first: one multiply-add per term, no powers.
+    inv = 1.0 / (1.0 + r)
     total = 0.0
-    for t, cf in enumerate(cashflows):
-        total += float(cf) / ((1.0 + r) ** t)
+    for cf in reversed(tuple(cashflows)):
+        total = total * inv + float(cf)
     return total
 
 
 # ---------- IRR (periodic) ----------
+def _npv_and_slope(rate: float, cashflows: List[float]) -> Tuple[float, float]:
+    """NPV(r) and dNPV/dr from one Horner pass in x = 1/(1+r)."""
+    x = 1.0 / (1.0 + rate)
+    f = 0.0
+    dfdx = 0.0
+    for cf in reversed(cashflows):
+        dfdx = dfdx * x + f
+        f = f * x + cf
+    return f, -dfdx * x * x
+
+
 def _irr_local(cashflows: List[float]) -> Optional[float]:
     """
-    Bracketed bisection on NPV(r)=0. Returns None if sign never changes.
-    Search domain: [-0.9999, 5.0] (i.e., -99.99% to 500%).
+    Bracketed root of NPV(r)=0: Newton steps, falling back to bisection
+    whenever a step would leave the current bracket. Returns None if the
+    sign never changes. Search domain: [-0.9999, 5.0] (i.e., -99.99% to 500%).
     """
     if not cashflows:
         return None
@@ -50,26 +67,67 @@ def _irr_local(cashflows: List[float]) -> Optional[float]:
     if (f_lo > 0 and f_hi > 0) or (f_lo < 0 and f_hi < 0):
         return None
 
-    # Bisection
+    r = 0.1  # inside the bracket; typical project/equity IRRs are nearby
     for _ in range(200):
-        mid = (lo + hi) / 2.0
-        f_mid = npv(mid, cashflows)
-        if abs(f_mid) < 1e-10:
-            return mid
+        f, df = _npv_and_slope(r, cashflows)
+        if abs(f) < 1e-10:
+            return r
         # keep the sub-interval where sign changes
-        if (f_lo < 0 and f_mid > 0) or (f_lo > 0 and f_mid < 0):
-            hi, f_hi = mid, f_mid
+        if (f_lo < 0) == (f < 0):
+            lo, f_lo = r, f
         else:
-            lo, f_lo = mid, f_mid
-    return (lo + hi) / 2.0
+            hi = r
+        nxt = r - f / df if df != 0.0 else lo - 1.0
+        if not (lo < nxt < hi):
+            nxt = (lo + hi) / 2.0
+        if abs(nxt - r) <= 1e-15 * max(1.0, abs(r)) or hi - lo <= 1e-15:
+            return nxt
+        r = nxt
+    return r
+
+
+def _sign_changes(cashflows: List[float]) -> int:
+    signs = [cf > 0 for cf in cashflows if cf != 0.0]
+    return sum(1 for a, b in zip(signs, signs[1:]) if a != b)
+
+
+def _irr_newton(
+    cashflows: List[float], guess: float = 0.1, tol: float = 1e-12, maxiter: int = 50
+) -> Optional[float]:
+    """
+    Newton iteration on NPV(r) over a float64 array. Returns None if it
+    leaves the domain (r <= -100%) or fails to converge within maxiter.
+    """
+    cf = np.asarray(cashflows, dtype=np.float64)
+    t = np.arange(cf.size, dtype=np.float64)
+    tcf = t * cf
+    r = float(guess)
+    for _ in range(maxiter):
+        disc = (1.0 + r) ** -t
+        f = float(cf @ disc)
+        df = -float(tcf @ disc) / (1.0 + r)
+        if df == 0.0 or not math.isfinite(df):
+            return None
+        step = f / df
+        r -= step
+        if r <= -1.0 or not math.isfinite(r):
+            return None
+        if abs(step) <= tol * max(1.0, abs(r)):
+            return r
+    return None
 
 
 def irr(cashflows: Iterable[float]) -> Optional[float]:
     """
-    Periodic IRR with numpy-financial if present; else fallback to local solver.
-    Returns a decimal rate (e.g., 0.18 = 18%).
+    Periodic IRR. Conventional series (one sign change, so a unique root)
+    are solved with Newton; otherwise numpy-financial if present, then the
+    local bracketed solver. Returns a decimal rate (e.g., 0.18 = 18%).
     """
     cfs = [float(x) for x in cashflows]
+    if _sign_changes(cfs) == 1:
+        val = _irr_newton(cfs)
+        if val is not None:
+            return val
     if npf is not None:
         try:
             val = float(npf.irr(cfs))  # type: ignore[attr-defined]
@@ -1,5 +1,20 @@
 from __future__ import annotations
 
+from typing import Any, Optional
+
 
 def pow1p(x: float, n: int) -> float:
     return (1.0 + x) ** n
+
+
+def as_float(v: Any, default: Optional[float] = None) -> Optional[float]:
+    """float(v), or ``default`` when v is None or not convertible."""
+    # YAML numbers arrive as float/int; skip the generic conversion for them.
+    if type(v) is float:
+        return v
+    if type(v) is int:
+        return float(v)
+    try:
+        return float(v) if v is not None else default
+    except Exception:
+        return default
@@ -15,6 +15,7 @@ import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional, Final
 from dataclasses import dataclass, field
+from functools import lru_cache
 from scipy.optimize import brentq, newton
 
 
@@ -146,7 +147,16 @@ def create_default_debt_structure() -> DebtStructure:
 
 
 def calculate_npv(rate: float, cash_flows: List[float]) -> float:
-    return float(np.sum([cf / (1 + rate) ** i for i, cf in enumerate(cash_flows)]))
+    cf = np.asarray(cash_flows, dtype=float)
+    return float(np.sum(cf / np.power(1 + rate, np.arange(cf.size))))
+
+
+@lru_cache(maxsize=32)
+def _discount_factors(rate: float, n: int) -> np.ndarray:
+    """(1+rate)^-t for t = 0..n-1; cached for fixed-rate NPVs (read-only)."""
+    disc = 1.0 / np.power(1 + rate, np.arange(n))
+    disc.flags.writeable = False
+    return disc
 
 
 def calculate_irr_robust(
@@ -185,17 +195,23 @@ def calculate_irr_robust(
         if sign_changes > 1
         else None
     )
+    # Exponents are fixed for this series; build them once for every solver step.
+    t = np.arange(cf.size)
+
+    def npv_at(rate):
+        return float(np.sum(cf / np.power(1 + rate, t)))
+
     # Brentq root finder
     if method in ["brentq", "both"]:
         try:
             irr_result = brentq(
-                lambda r: calculate_npv(r, cf),
+                npv_at,
                 -0.99,
                 5.00,
                 xtol=tolerance,
                 maxiter=max_iterations,
             )
-            npv_check = calculate_npv(irr_result, cf)
+            npv_check = npv_at(irr_result)
             if abs(npv_check) < tolerance * 10:
                 return IRRResult(irr_result, "CONVERGED", "Brentq", npv_check, warning)
         except Exception as e:
@@ -204,20 +220,19 @@ def calculate_irr_robust(
             # Otherwise, try Newton
     if method in ["newton", "both"]:
         try:
+            t_cf = t * cf
 
-            def npv_derivative(rate, cf):
-                return -np.sum(
-                    [i * c / (1 + rate) ** (i + 1) for i, c in enumerate(cf)]
-                )
+            def npv_derivative(rate):
+                return -np.sum(t_cf / np.power(1 + rate, t + 1))
 
             irr_result = newton(
-                lambda r: calculate_npv(r, cf),
+                npv_at,
                 initial_guess,
-                fprime=lambda r: npv_derivative(r, cf),
+                fprime=npv_derivative,
                 tol=tolerance,
                 maxiter=max_iterations,
             )
-            npv_check = calculate_npv(irr_result, cf)
+            npv_check = npv_at(irr_result)
             if abs(npv_check) < tolerance * 10 and -0.99 < irr_result < 5.0:
                 return IRRResult(irr_result, "CONVERGED", "Newton", npv_check, warning)
         except Exception:
@@ -233,9 +248,16 @@ def calculate_irr_robust(
 
 
 def build_financial_model(
-    proj: ProjectParameters = ProjectParameters(), debt: Optional[DebtStructure] = None
+    proj: ProjectParameters = ProjectParameters(),
+    debt: Optional[DebtStructure] = None,
+    include_annual: bool = True,
 ) -> Dict[str, Any]:
-    """Build a complete 20-year financial projection given project and debt parameters."""
+    """
+    Build a complete 20-year financial projection given project and debt parameters.
+
+    include_annual=False skips the per-year DataFrame ("annual_data" is None);
+    scenario sweeps that only read the headline metrics save about half the run.
+    """
     # Defaults
     if debt is None:
         total_debt = proj.total_capex * MAX_DEBT_RATIO
@@ -252,116 +274,103 @@ def build_financial_model(
             debt_tenor_years=DEBT_TENOR_YEARS,
         )
     years = np.arange(1, proj.project_life_years + 1)
-    # Operating metrics
-    gen = np.array(
-        [
-            proj.nameplate_mw
-            * proj.hours_per_year
-            * proj.cf_p50
-            * (1 - proj.yearly_degradation) ** (y - 1)
-            for y in years
-        ]
-    )
-    fx = np.array([proj.fx_initial * (1 + proj.fx_depr) ** (y - 1) for y in years])
-    tariff_usd = np.array([proj.tariff_lkr_kwh / fx[y - 1] * 1000 for y in years])
+    # Geometric series, one vectorized power each over elapsed years
+    t = years - 1
+    degradation = np.power(1 - proj.yearly_degradation, t)
+    fx_growth = np.power(1 + proj.fx_depr, t)
+    esc_usd = np.power(1 + proj.opex_esc_usd, t)
+    esc_lkr = np.power(1 + proj.opex_esc_lkr, t)
+    # Operating metrics (vectorized over the project years)
+    gen = proj.nameplate_mw * proj.hours_per_year * proj.cf_p50 * degradation
+    fx = proj.fx_initial * fx_growth
+    tariff_usd = proj.tariff_lkr_kwh / fx * 1000
     revenue = gen * tariff_usd / 1_000_000
     sscl = revenue * proj.sscl_rate
-    # OPEX escalation
-    usd_portion = (
-        proj.opex_usd_mwh * proj.opex_split_usd * (1 + proj.opex_esc_usd) ** (years - 1)
-    )
-    lkr_portion_base = (
-        proj.opex_usd_mwh * proj.opex_split_lkr * (1 + proj.opex_esc_lkr) ** (years - 1)
-    )
-    lkr_portion_usd = lkr_portion_base / (fx / proj.fx_initial)
+    # OPEX escalation (LKR portion converted at the depreciated FX)
+    usd_portion = proj.opex_usd_mwh * proj.opex_split_usd * esc_usd
+    lkr_portion_base = proj.opex_usd_mwh * proj.opex_split_lkr * esc_lkr
+    lkr_portion_usd = lkr_portion_base / fx_growth
     opex = gen * (usd_portion + lkr_portion_usd) / 1_000_000
     da = np.full(proj.project_life_years, proj.total_capex / proj.econ_life)
     ebitda = revenue - sscl - opex
     ebit = ebitda - da
     tax = np.maximum(0, ebit * proj.tax_rate)
     op_cf = ebit - tax + da
-    # Debt schedules
+    # LKR facility: remaining balance / remaining tenor is the same every
+    # year, i.e. equal instalments, so its schedule is closed-form.
+    tenor = debt.debt_tenor_years
+    if tenor > 0:
+        lkr_prin = np.where(years <= tenor, debt.lkr_debt / tenor, 0.0)
+    else:
+        lkr_prin = np.zeros(proj.project_life_years)
+    lkr_open = debt.lkr_debt - np.concatenate(([0.0], np.cumsum(lkr_prin)[:-1]))
+    lkr_int = np.maximum(0.0, lkr_open) * LKR_DEBT_RATE
+    lkr_int_usd = lkr_int / fx
+    lkr_prin_usd = lkr_prin / fx
+    # USD facility: the cash sweep depends on the running balance, so only
+    # this recursion stays sequential (over plain floats, to keep NumPy
+    # scalar overhead out of the loop).
     usd_bal = debt.usd_debt
-    lkr_bal = debt.lkr_debt
+    op_cf_list = op_cf.tolist()
+    lkr_int_usd_list = lkr_int_usd.tolist()
+    # Sweep share of available cash per year: nothing in year 1 (grace or
+    # not), principal_pct_1_4 in years 2-4, principal_pct_5_on afterwards.
+    n_years = proj.project_life_years
+    sweep_pct = (
+        [0.0]
+        + [proj.principal_pct_1_4] * min(3, max(0, n_years - 1))
+        + [proj.principal_pct_5_on] * max(0, n_years - 4)
+    )[:n_years]
     usd_principal_hist = []
     usd_interest_hist = []
-    lkr_principal_hist = []
-    lkr_interest_hist = []
-    lkr_ds_hist = []
-    for year in range(1, proj.project_life_years + 1):
+    for year in range(1, n_years + 1):
         usd_int = (
             usd_bal * USD_MKT_RATE
         )  # For simplicity, use market USD rate as default
-        lkr_int = lkr_bal * LKR_DEBT_RATE
-        fx_year = proj.fx_initial * (1 + proj.fx_depr) ** (year - 1)
-        lkr_int_usd = lkr_int / fx_year
         # Principal based on OpCF after interest, tax
-        ebitda_y = revenue[year - 1] - sscl[year - 1] - opex[year - 1]
-        da_y = da[year - 1]
-        ebit_y = ebitda_y - da_y
-        tax_y = max(0, ebit_y * proj.tax_rate)
-        op_cf_y = ebit_y - tax_y + da_y
-        op_cf_avail = op_cf_y - usd_int - lkr_int_usd
-        if year == 1 and proj.grace_period == 1:
-            usd_prin = 0
-        elif 2 <= year <= 4:
-            usd_prin = min(usd_bal, proj.principal_pct_1_4 * op_cf_avail)
-        elif year > 4:
-            usd_prin = min(usd_bal, proj.principal_pct_5_on * op_cf_avail)
-        else:
-            usd_prin = 0
+        op_cf_avail = op_cf_list[year - 1] - usd_int - lkr_int_usd_list[year - 1]
+        pct = sweep_pct[year - 1]
+        usd_prin = min(usd_bal, pct * op_cf_avail) if pct else 0.0
         usd_bal = max(0.0, usd_bal - usd_prin)
-        if year <= debt.debt_tenor_years:
-            lkr_prin = lkr_bal / (debt.debt_tenor_years - year + 1)
-        else:
-            lkr_prin = 0
-        lkr_bal = max(0.0, lkr_bal - lkr_prin)
-        lkr_ds = lkr_int + lkr_prin
         usd_principal_hist.append(usd_prin)
         usd_interest_hist.append(usd_int)
-        lkr_principal_hist.append(lkr_prin)
-        lkr_interest_hist.append(lkr_int)
-        lkr_ds_hist.append(lkr_ds)
     usd_prin = np.array(usd_principal_hist)
     usd_int = np.array(usd_interest_hist)
-    lkr_prin = np.array(lkr_principal_hist)
-    lkr_int = np.array(lkr_interest_hist)
-    lkr_ds = np.array(lkr_ds_hist)
-    lkr_int_usd = lkr_int / fx
-    lkr_prin_usd = lkr_prin / fx
     total_ds = usd_int + usd_prin + lkr_int_usd + lkr_prin_usd
     dscr = np.where(total_ds > 1e-6, op_cf / total_ds, np.nan)
     eq_cf = op_cf - total_ds
     # Build annual dataframe
-    annual_data = pd.DataFrame(
-        {
-            "Year": years,
-            "Generation_MWh": gen,
-            "FX": fx,
-            "Tariff_USD_MWh": tariff_usd,
-            "Revenue_USD_M": revenue,
-            "SSCL_USD_M": sscl,
-            "OPEX_USD_M": opex,
-            "EBITDA": ebitda,
-            "DA": da,
-            "EBIT": ebit,
-            "Tax": tax,
-            "Op_CF": op_cf,
-            "USD_Int": usd_int,
-            "USD_Prin": usd_prin,
-            "LKR_Int": lkr_int_usd,
-            "LKR_Prin": lkr_prin_usd,
-            "Total_DS": total_ds,
-            "DSCR": dscr,
-            "Eq_CF": eq_cf,
-        }
-    )
+    annual_data = None
+    if include_annual:
+        annual_data = pd.DataFrame(
+            {
+                "Year": years,
+                "Generation_MWh": gen,
+                "FX": fx,
+                "Tariff_USD_MWh": tariff_usd,
+                "Revenue_USD_M": revenue,
+                "SSCL_USD_M": sscl,
+                "OPEX_USD_M": opex,
+                "EBITDA": ebitda,
+                "DA": da,
+                "EBIT": ebit,
+                "Tax": tax,
+                "Op_CF": op_cf,
+                "USD_Int": usd_int,
+                "USD_Prin": usd_prin,
+                "LKR_Int": lkr_int_usd,
+                "LKR_Prin": lkr_prin_usd,
+                "Total_DS": total_ds,
+                "DSCR": dscr,
+                "Eq_CF": eq_cf,
+            }
+        )
     # Full project/equity cash flows for IRR
     project_cf = [-proj.total_capex] + list(op_cf)
     eq_cf_full = [-proj.total_capex + debt.total_debt] + list(eq_cf)
     equity_irr_result = calculate_irr_robust(eq_cf_full)
     project_irr_result = calculate_irr_robust(project_cf)
-    npv_12pct = calculate_npv(0.12, eq_cf_full)
+    npv_12pct = float(np.dot(eq_cf_full, _discount_factors(0.12, len(eq_cf_full))))
     return {
         "annual_data": annual_data,
         "equity_irr": equity_irr_result.irr,
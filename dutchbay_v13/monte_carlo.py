@@ -4,7 +4,8 @@ Monte Carlo Simulation module for Dutch Bay 150MW Wind Farm Financial Model V12
 Generates scenario analysis by varying key parameters (debt, fx, CF, rates)
 ENHANCED with type hints, parameter correlation, and validation
 """
-from typing import Optional, Dict
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
 import numpy as np
 np.random.seed(12345)  # deterministic for tests
 import pandas as pd
@@ -13,62 +14,72 @@ from .legacy_v12 import (
     create_default_parameters,
     create_default_debt_structure,
     build_financial_model,
-    ProjectParameters,
-    DebtStructure,
 )
 
-try:  # legacy-safe bridge for validator
-    from parameter_validation import validate_project_parameters
-except Exception:
-    def validate_project_parameters(_):
-        return True
+from .validate import PROJECT_BOUNDS
 import warnings
 
 
-def generate_mc_parameters(
+# Sampled inputs, in scenario-table column order, with their uniform bounds.
+MC_COLUMNS = ("usd_rate", "lkr_rate", "debt_ratio", "fx_depr", "capacity_factor")
+_MC_LOW = np.array([0.065, 0.075, 0.5, 0.03, 0.38])
+_MC_HIGH = np.array([0.09, 0.09, 0.8, 0.05, 0.42])
+
+
+def generate_mc_table(
     n_scenarios: int, seed: Optional[int] = None, correlation: bool = False
-) -> Dict[str, np.ndarray]:
+) -> np.ndarray:
     """
-    Generate Monte Carlo parameter samples.
-
-    Args:
-        n_scenarios: Number of scenarios to generate
-        seed: Random seed for reproducibility
-        correlation: Whether to apply correlation between USD and LKR rates
+    Generate Monte Carlo samples as one (n_scenarios, 5) float64 table.
 
-    Returns:
-        Dictionary of parameter arrays
+    Columns follow MC_COLUMNS. Draws are taken parameter by parameter, so a
+    given seed yields the same samples as drawing each column separately.
     """
     rng = np.random.default_rng(seed)
+    table = np.empty((n_scenarios, len(MC_COLUMNS)))
+    first = 0
 
     if correlation:
         # Generate correlated USD and LKR rates
         mean = [0.075, 0.0825]  # USD, LKR means
         cov = [[0.0001, 0.00008], [0.00008, 0.00015]]  # Correlation ~0.8
         rates = rng.multivariate_normal(mean, cov, n_scenarios)
-        usd_rate = np.clip(rates[:, 0], 0.065, 0.09)
-        lkr_rate = np.clip(rates[:, 1], 0.075, 0.09)
-    else:
-        usd_rate = rng.uniform(0.065, 0.09, n_scenarios)
-        lkr_rate = rng.uniform(0.075, 0.09, n_scenarios)
-
-    return {
-        "usd_rate": usd_rate,
-        "lkr_rate": lkr_rate,
-        "debt_ratio": rng.uniform(0.5, 0.8, n_scenarios),
-        "fx_depr": rng.uniform(0.03, 0.05, n_scenarios),
-        "capacity_factor": rng.uniform(0.38, 0.42, n_scenarios),
-    }
+        table[:, 0] = np.clip(rates[:, 0], 0.065, 0.09)
+        table[:, 1] = np.clip(rates[:, 1], 0.075, 0.09)
+        first = 2
+
+    u = rng.random((len(MC_COLUMNS) - first, n_scenarios))
+    low = _MC_LOW[first:, None]
+    table[:, first:] = (low + (_MC_HIGH[first:, None] - low) * u).T
+    return table
 
 
-def run_monte_carlo(
+def generate_mc_samples(
+    n_scenarios: int, seed: Optional[int] = None, correlation: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Generate Monte Carlo parameter samples for the V12 model.
+
+    Args:
+        n_scenarios: Number of scenarios to generate
+        seed: Random seed for reproducibility
+        correlation: Whether to apply correlation between USD and LKR rates
+
+    Returns:
+        Dictionary of parameter arrays (column views of generate_mc_table)
+    """
+    table = generate_mc_table(n_scenarios, seed, correlation)
+    return {k: table[:, j] for j, k in enumerate(MC_COLUMNS)}
+
+
+def run_monte_carlo_model(
     iterations: int = 1000,
     seed: Optional[int] = None,
     correlation: bool = False,
     validate: bool = True,
 ) -> pd.DataFrame:
     """
-    Run Monte Carlo simulation with enhanced error handling.
+    Run Monte Carlo simulation over the V12 model with enhanced error handling.
 
     Args:
         iterations: Number of MC scenarios
@@ -81,59 +92,59 @@ def run_monte_carlo(
     """
     params = create_default_parameters()
     debt_template = create_default_debt_structure()
-    scenarios = generate_mc_parameters(iterations, seed, correlation)
-    out_data = []
+    scenarios = generate_mc_table(iterations, seed, correlation)
+    # Results are collected column-wise and handed to pandas as-is.
+    out_cols: Dict[str, List[Any]] = {
+        k: []
+        for k in (
+            "iteration", "usd_rate", "lkr_rate", "debt_ratio", "fx_depr",
+            "capacity_factor", "equity_irr", "project_irr", "npv_12pct", "min_dscr",
+        )
+    }
 
     failed_count = 0
 
-    for i in range(iterations):
+    # Only cf_p50 and fx_depr are bounds-checked, and both vary per scenario:
+    # check those two columns for the whole table at once.
+    in_bounds = [True] * iterations
+    if validate:
+        cf_lo, cf_hi = PROJECT_BOUNDS["cf_p50"]
+        fx_lo, fx_hi = PROJECT_BOUNDS["fx_depr"]
+        cf = scenarios[:, MC_COLUMNS.index("capacity_factor")]
+        fx = scenarios[:, MC_COLUMNS.index("fx_depr")]
+        in_bounds = ((cf >= cf_lo) & (cf <= cf_hi) & (fx >= fx_lo) & (fx <= fx_hi)).tolist()
+
+    for i, (urate, lrate, dratio, fxdepr, capfac) in enumerate(scenarios.tolist()):
         try:
-            capfac = scenarios["capacity_factor"][i]
-            fxdepr = scenarios["fx_depr"][i]
-            dratio = scenarios["debt_ratio"][i]
-            urate = scenarios["usd_rate"][i]
-            lrate = scenarios["lkr_rate"][i]
-
-            p = ProjectParameters(
-                **{**params.__dict__, "cf_p50": capfac, "fx_depr": fxdepr}
-            )
+            if not in_bounds[i]:
+                warnings.warn(
+                    f"Scenario {i+1} validation failed: cf_p50={capfac}, fx_depr={fxdepr}"
+                )
+                continue
 
-            if validate:
-                is_valid, errors = validate_project_parameters(p.__dict__)
-                if not is_valid:
-                    warnings.warn(f"Scenario {i+1} validation failed: {errors[0]}")
-                    continue
+            p = replace(params, cf_p50=capfac, fx_depr=fxdepr)
 
             td = p.total_capex * dratio
             ud = td * 0.45
             ld = td - ud
-            debt = DebtStructure(
-                **{
-                    **debt_template.__dict__,
-                    "total_debt": td,
-                    "usd_debt": ud,
-                    "lkr_debt": ld,
-                    "usd_mkt_rate": urate,
-                    "lkr_rate": lrate,
-                }
+            debt = replace(
+                debt_template,
+                total_debt=td,
+                usd_debt=ud,
+                lkr_debt=ld,
+                usd_mkt_rate=urate,
+                lkr_rate=lrate,
             )
 
-            results = build_financial_model(p, debt)
-
-            out_data.append(
-                {
-                    "iteration": i + 1,
-                    "usd_rate": urate,
-                    "lkr_rate": lrate,
-                    "debt_ratio": dratio,
-                    "fx_depr": fxdepr,
-                    "capacity_factor": capfac,
-                    "equity_irr": results["equity_irr"],
-                    "project_irr": results["project_irr"],
-                    "npv_12pct": results["npv_12pct"],
-                    "min_dscr": results["min_dscr"],
-                }
+            results = build_financial_model(p, debt, include_annual=False)
+
+            row = (
+                i + 1, urate, lrate, dratio, fxdepr, capfac,
+                results["equity_irr"], results["project_irr"],
+                results["npv_12pct"], results["min_dscr"],
             )
+            for col, v in zip(out_cols.values(), row):
+                col.append(v)
         except Exception as e:
             failed_count += 1
             warnings.warn(f"Scenario {i+1} failed: {str(e)}")
@@ -142,7 +153,7 @@ def run_monte_carlo(
     if failed_count > 0:
         warnings.warn(f"Monte Carlo: {failed_count}/{iterations} scenarios failed")
 
-    df = pd.DataFrame(out_data)
+    df = pd.DataFrame(out_cols)
 
     # Add summary statistics as attributes
     if len(df) > 0:
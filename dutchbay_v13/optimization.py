@@ -11,6 +11,7 @@ import json
 import pandas as pd
 import yaml
 from .charts import pareto_chart
+from .yaml_compat import SafeLoader
 import numpy as np
 import warnings
 from scipy.optimize import minimize, Bounds, NonlinearConstraint
@@ -297,7 +298,8 @@ def _normalize_grid(val, is_int: bool = False):
 def optimize_debt_pareto_yaml(
     grid_yaml: str | Path, outdir: str | Path | None = None
 ) -> Dict[str, Any]:
-    data = yaml.safe_load(Path(grid_yaml).read_text(encoding="utf-8")) or {}
+    with Path(grid_yaml).open("rb") as fh:
+        data = yaml.load(fh, Loader=SafeLoader) or {}
     grids = data.get("grids", [])
     results = []
     if outdir:
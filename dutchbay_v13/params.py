@@ -9,6 +9,7 @@ Centralized parameter loader and accessors.
 
 No business policy defaults here: floors, caps, rates must live in YAML.
 """
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Union, List, Mapping
 
@@ -17,15 +18,24 @@ try:  # Light dependency; present in this repo
 except Exception as e:  # pragma: no cover
     raise RuntimeError("PyYAML is required to load configuration") from e
 
+from .finance.utils import as_float as _as_float
+from .parse_cache import load_cached
+from .yaml_compat import SafeLoader
+
 
 # --------------------------- basic IO & merge ---------------------------
 
+def _read_yaml(p: str) -> Any:
+    with open(p, 'rb') as fh:
+        return yaml.load(fh, Loader=SafeLoader) or {}
+
+
 def _load_yaml_file(p: Union[str, Path]) -> Dict[str, Any]:
     path = Path(p)
     if not path.exists():
         raise FileNotFoundError(f"YAML not found: {path}")
-    with path.open('r', encoding='utf-8') as fh:
-        data = yaml.safe_load(fh) or {}
+    # load_cached hands back a private copy; callers merge into and mutate it
+    data = load_cached(path, _read_yaml)
     if not isinstance(data, dict):
         raise ValueError(f"Top-level YAML must be a mapping/dict: {path}")
     return data
@@ -43,11 +53,20 @@ def _deep_merge(base: Dict[str, Any], override: Mapping[str, Any]) -> Dict[str,
 
 # --------------------------- validation bridge -------------------------
 
-def _maybe_validate(params: Dict[str, Any], mode: str = "strict") -> None:
-    """Call project validator if available. No-op if module not present."""
+@lru_cache(maxsize=1)
+def _validator():
+    """Resolve the project validator once; None if it is not available."""
     try:
         from .validate import validate as _validate  # type: ignore
     except Exception:
+        return None
+    return _validate
+
+
+def _maybe_validate(params: Dict[str, Any], mode: str = "strict") -> None:
+    """Call project validator if available. No-op if module not present."""
+    _validate = _validator()
+    if _validate is None:
         return
     _validate(params, mode=mode)  # let it raise on failure
 
@@ -107,13 +126,6 @@ def _get(d: Dict[str, Any], path: Iterable[str], default: Any = None) -> Any:
     return cur
 
 
-def _as_float(v: Any, default: Optional[float] = None) -> Optional[float]:
-    try:
-        return float(v) if v is not None else default
-    except Exception:
-        return default
-
-
 # Project basics
 
 def capacity_mw(p: Dict[str, Any]) -> float:
@@ -189,6 +201,8 @@ def fx_curve_lkr_per_usd(p: Dict[str, Any], years: int) -> List[float]:
     depr = _get(p, ["FX", "annual_depr"])
     if start is None or depr is None:
         raise KeyError("Provide FX.curve_lkr_per_usd OR both FX.start_lkr_per_usd and FX.annual_depr in YAML.")
+    if float(depr) == 0.0:
+        return [float(start)] * max(1, years)
     out: List[float] = []
     cur = float(start)
     for _ in range(max(1, years)):
@@ -199,42 +213,30 @@ def fx_curve_lkr_per_usd(p: Dict[str, Any], years: int) -> List[float]:
 
 # Financing terms (normalized view)
 
+# (child map, or None for the top level; fields; coercion). No defaults here.
+_FT_COERCE = (
+    (None, frozenset({"debt_ratio", "dscr_target", "min_dscr", "dscr_haircut_factor"}), float),
+    (None, frozenset({"tenor_years", "interest_only_years"}), int),
+    ("mix", frozenset({"lkr_max", "dfi_max", "usd_commercial_min"}), float),        # mix caps
+    ("rates", frozenset({"lkr_floor", "usd_floor", "dfi_floor"}), float),            # rate floors
+    ("reserves", frozenset({"dsra_months", "receivables_guarantee_months"}), int),
+    ("fees", frozenset({"upfront_pct", "commitment_pct"}), float),
+)
+
+
 def financing_terms(p: Dict[str, Any]) -> Dict[str, Any]:
     ft = dict(_get(p, ["Financing_Terms"], {}) or {})
-    # normalize child maps if absent
-    ft.setdefault("mix", {})
-    ft.setdefault("rates", {})
-    ft.setdefault("reserves", {})
-    ft.setdefault("fees", {})
-    # Coerce a few types if present (no defaults here)
-    for key in ("debt_ratio", "dscr_target", "min_dscr", "dscr_haircut_factor"):
-        if key in ft and ft[key] is not None:
-            ft[key] = float(ft[key])
-    for key in ("tenor_years", "interest_only_years"):
-        if key in ft and ft[key] is not None:
-            ft[key] = int(ft[key])
+    # normalize child maps if absent; copies, so coercion never writes into p
+    for child in ("mix", "rates", "reserves", "fees"):
+        ft[child] = dict(ft.get(child) or {})
+    # Coerce a few types if present: only the fields actually given are visited
+    for child, fields, conv in _FT_COERCE:
+        m = ft if child is None else ft[child]
+        for key in fields & m.keys():
+            if m[key] is not None:
+                m[key] = conv(m[key])
     if "amortization" in ft and isinstance(ft["amortization"], str):
         ft["amortization"] = str(ft["amortization"]).lower()
-    # mix caps
-    mix = ft["mix"]
-    for key in ("lkr_max", "dfi_max", "usd_commercial_min"):
-        if key in mix and mix[key] is not None:
-            mix[key] = float(mix[key])
-    # rate floors
-    rates = ft["rates"]
-    for key in ("lkr_floor", "usd_floor", "dfi_floor"):
-        if key in rates and rates[key] is not None:
-            rates[key] = float(rates[key])
-    # reserves
-    res = ft["reserves"]
-    for key in ("dsra_months", "receivables_guarantee_months"):
-        if key in res and res[key] is not None:
-            res[key] = int(res[key])
-    # fees
-    fees = ft["fees"]
-    for key in ("upfront_pct", "commitment_pct"):
-        if key in fees and fees[key] is not None:
-            fees[key] = float(fees[key])
     return ft
 
     
\ No newline at end of file
@@ -0,0 +1,34 @@
+# dutchbay_v13/parse_cache.py
+"""
+Bounded cache of parsed input files, shared by the config/params/validate loaders.
+
+Entries are keyed on (resolved path, mtime_ns, size, parser): an edited file
+misses and is re-parsed, and the least recently used entry is dropped once
+the cache is full. Callers always receive a private deep copy.
+"""
+from __future__ import annotations
+
+import copy
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Union
+
+Parser = Callable[[str], Any]
+
+
+@lru_cache(maxsize=128)
+def _parse(path: str, mtime_ns: int, size: int, parse: Parser) -> Any:
+    # mtime_ns/size only take part in the key. Exceptions propagate and
+    # are not cached.
+    return parse(path)
+
+
+def load_cached(path: Union[str, os.PathLike], parse: Parser) -> Any:
+    """Return ``parse(resolved_path)``, reusing the result while the file is unchanged."""
+    resolved = str(Path(path).resolve())
+    st = os.stat(resolved)
+    return copy.deepcopy(_parse(resolved, st.st_mtime_ns, st.st_size, parse))
+
+
+__all__ = ["load_cached"]
@@ -1,27 +1,36 @@
-
-def _env_strict() -> bool:
-    return os.getenv("VALIDATION_MODE", "relaxed").lower() == "strict"
-
-def _require_annual_if_strict(params, where: str = "") -> None:
-    if _env_strict() and not params.get("annual"):
-        msg = "strict mode requires 'annual' array in config"
-        if where:
-            msg = f"{msg} ({where})"
-        raise SystemExit(msg)
 # dutchbay_v13/scenario_runner.py
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import os, sys
-import json, csv
+import io, json, csv
+
+# Optional fast JSON encoder; stdlib json is the fallback.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
 
 from .validate import (
     load_params_from_file,
     validate_params_dict,
     validate_debt_dict,
 )
+from .adapters import run_irr
+
+def _env_strict() -> bool:
+    return os.getenv("VALIDATION_MODE", "relaxed").lower() == "strict"
+
+def _require_annual_if_strict(params, where: str = "") -> None:
+    if _env_strict() and not params.get("annual"):
+        msg = "strict mode requires 'annual' array in config"
+        if where:
+            msg = f"{msg} ({where})"
+        raise SystemExit(msg)
 
 # Default schema so tests can fail without monkeypatching
 SCHEMA: Dict[str, Dict[str, float]] = {
@@ -90,19 +99,32 @@ def _validate_debt_with_schema(data: Dict[str, Any], *, mode: str = "relaxed") -
         return [str(e)]
 
 def _write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
-    with path.open("w", encoding="utf-8") as f:
+    if orjson is not None:
+        buf = bytearray()
         for row in rows:
-            f.write(json.dumps(row) + "\n")
-
-def _write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
-    if not rows:
-        path.write_text("", encoding="utf-8")
+            buf += orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+        path.write_bytes(bytes(buf))
         return
-    hdr = sorted(rows[0].keys())
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("".join(json.dumps(row) + "\n" for row in rows))
+
+def _dumps_pretty(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+def _write_csv(path: Path, rows: List[Dict[str, Any]], header: Optional[List[str]] = None) -> None:
+    # Union of keys across all rows (one hashed pass), in the stable sorted order;
+    # with no rows, fall back to the caller's header (or write nothing).
+    hdr = sorted({k for row in rows for k in row}) if rows else (header or [])
+    # Format in memory, then hand the OS one write.
+    buf = io.StringIO(newline="")
+    w = csv.writer(buf)
+    if hdr:
+        w.writerow(hdr)
+    w.writerows([row.get(k, "") for k in hdr] for row in rows)
     with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=hdr)
-        w.writeheader()
-        w.writerows(rows)
+        f.write(buf.getvalue())
 
 def run_dir(
     config: str | Path,
@@ -112,6 +134,7 @@ def run_dir(
     fmt: str = "jsonl",
     save_annual: bool = False,
     require_annual: bool = False,
+    write_summary: bool = True,
     **kwargs,
 ) -> RunResult | Dict[str, Any]:
     # accept legacy alias
@@ -139,7 +162,8 @@ def run_dir(
     params = load_params_from_file(cfg_path)
 
     annual: List[Dict[str, float]] | None = params.get("annual")
-    if not annual:
+    synthesized = not annual
+    if synthesized:
         if require_annual:
             raise SystemExit("annual CFADS required in strict mode")
         lifetime = int(params.get("project", {}).get("timeline", {}).get("lifetime_years", 25))
@@ -148,18 +172,30 @@ def run_dir(
     summary = validate_and_run(mode, params, annual)
 
     summary_path = out / "summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    # write_summary=False leaves the shared summary.json to the caller
+    # (run_matrix's pool workers).
+    if write_summary:
+        # Under save_annual the annual rows get their own results file; keep
+        # them out of summary.json instead of serializing them twice.
+        on_disk = {k: v for k, v in summary.items() if k != "annual"} if save_annual else summary
+        summary_path.write_text(_dumps_pretty(on_disk), encoding="utf-8")
 
     results_path: Optional[Path] = None
     if save_annual:
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base = f"{cfg_path.stem}_results_{stamp}"
+        rows = summary.get("annual", [])
+        # A synthesized flat-zero table carries no information; emit the
+        # layout only (CSV header / empty JSONL) instead of N zero rows.
+        header = sorted(rows[0]) if rows else None
+        if synthesized:
+            rows = []
         if fmt == "jsonl":
             results_path = out / f"{base}.jsonl"
-            _write_jsonl(results_path, summary.get("annual", []))
+            _write_jsonl(results_path, rows)
         elif fmt == "csv":
             results_path = out / f"{base}.csv"
-            _write_csv(results_path, summary.get("annual", []))
+            _write_csv(results_path, rows, header)
         else:
             raise SystemExit(f"unknown fmt: {fmt}")
 
@@ -168,7 +204,6 @@ def run_dir(
 def validate_and_run(mode: str, params: Dict[str, Any], annual: List[Dict[str, Any]]) -> Dict[str, Any]:
     # relaxed by default; no hard requirement for 'metrics'
     validate_params_dict(params, mode="relaxed")
-    from .adapters import run_irr
     return run_irr(params, annual)
 
 # Legacy helpers
@@ -181,13 +216,42 @@ def load_config(path: str | Path) -> dict:
 def run_single_scenario(cfg_path: str | Path, out_dir: str | Path, *, fmt: str = "jsonl"):
     return run_dir(Path(cfg_path), Path(out_dir), mode="irr", fmt=fmt, save_annual=False)
 
-def run_matrix(dir_path: str | Path, out_dir: str | Path, pattern: str = "*.yaml", *, fmt: str = "jsonl"):
+# A scenario runs in well under a millisecond while starting a process pool
+# costs ~10 ms, so only fan out by default when there is enough work.
+_PARALLEL_MIN_SCENARIOS = 64
+
+def run_matrix(
+    dir_path: str | Path,
+    out_dir: str | Path,
+    pattern: str = "*.yaml",
+    *,
+    fmt: str = "jsonl",
+    workers: Optional[int] = None,
+):
+    """
+    Run every scenario file matching ``pattern``. ``workers=None`` uses a
+    process pool only for large matrices on multi-core hosts; ``workers=1``
+    forces the serial loop and ``workers>1`` forces the pool.
+    """
     d = Path(dir_path)
     o = Path(out_dir)
     o.mkdir(parents=True, exist_ok=True)
-    results = {}
-    for cfg in sorted(d.glob(pattern)):
-        results[cfg.name] = run_dir(cfg, o, mode="irr", fmt=fmt, save_annual=False)
+    cfgs = sorted(d.glob(pattern))
+    one = partial(run_dir, out_dir=o, mode="irr", fmt=fmt, save_annual=False)
+    if workers is None:
+        cpus = os.cpu_count() or 1
+        workers = cpus if cpus > 1 and len(cfgs) >= _PARALLEL_MIN_SCENARIOS else 1
+    if len(cfgs) < 2 or workers == 1:
+        return {cfg.name: one(cfg) for cfg in cfgs}
+    # Scenarios are independent and CPU-bound; fan out across processes.
+    # Workers never touch the shared out/summary.json; the parent writes it
+    # once, as the serial loop leaves it (last scenario in sorted order).
+    one = partial(one, write_summary=False)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        chunksize = max(1, len(cfgs) // (4 * workers))
+        results = dict(zip((cfg.name for cfg in cfgs), ex.map(one, cfgs, chunksize=chunksize)))
+    last = results[cfgs[-1].name]
+    last.summary_path.write_text(_dumps_pretty(last.summary), encoding="utf-8")
     return results
 
     
\ No newline at end of file
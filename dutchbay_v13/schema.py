@@ -11,6 +11,8 @@ try:
 except Exception as e:  # pragma: no cover
     raise RuntimeError("PyYAML is required to load schema files") from e
 
+from .yaml_compat import SafeLoader
+
 
 # --------------------------------------------------------------------
 # Public surface
@@ -71,18 +73,18 @@ def register_extra_schema(path: str) -> None:
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    with path.open("rb") as fh:
+        data = yaml.load(fh, Loader=SafeLoader)
     if not isinstance(data, dict):
         raise ValueError(f"Schema at {path} must be a mapping at top level.")
     return data
 
 
 def _load_one_schema(path: str) -> Optional[Dict[str, Any]]:
+    # No exists() pre-check: a missing file surfaces as OSError from open(),
+    # which lands in the same skip branch without an extra stat per path.
     try:
         p = Path(path)
-        if not p.exists():
-            return None
         if p.suffix.lower() in (".yaml", ".yml"):
             return _load_yaml(p)
         # Allow JSON content via YAML loader as well (YAML is superset)
@@ -97,11 +99,10 @@ def iter_schema_documents() -> Iterable[Dict[str, Any]]:
     Yield parsed schema mappings from BASE_SCHEMA_PATHS + EXTRA_SCHEMA_PATHS.
     Missing or invalid files are skipped safely.
     """
-    seen: set[str] = set()
-    for path in BASE_SCHEMA_PATHS + EXTRA_SCHEMA_PATHS:
-        if not path or path in seen:
+    # dict.fromkeys: ordered de-dupe in one pass
+    for path in dict.fromkeys(BASE_SCHEMA_PATHS + EXTRA_SCHEMA_PATHS):
+        if not path:
             continue
-        seen.add(path)
         doc = _load_one_schema(path)
         if doc:
             yield doc
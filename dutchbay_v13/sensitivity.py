@@ -4,6 +4,7 @@ Sensitivity analysis module for Dutch Bay 150MW
 One-at-a-time stress test (tornado chart compatible)
 ENHANCED with additional parameters, type hints, and validation
 """
+from dataclasses import replace
 from typing import Optional, Dict, Any, List
 import pandas as pd
 
@@ -11,8 +12,6 @@ from .legacy_v12 import (
     build_financial_model,
     create_default_parameters,
     create_default_debt_structure,
-    ProjectParameters,
-    DebtStructure,
 )
 
 import warnings
@@ -72,7 +71,7 @@ def run_sensitivity_analysis(
     results: List[Dict[str, Any]] = []
 
     try:
-        base_model = build_financial_model(params, debt)
+        base_model = build_financial_model(params, debt, include_annual=False)
     except Exception as e:
         warnings.warn(f"Base model failed: {e}")
         return pd.DataFrame()
@@ -83,15 +82,14 @@ def run_sensitivity_analysis(
 
         for val in s["stress"]:
             try:
-                sp = ProjectParameters(**{**params.__dict__})
-                sd = DebtStructure(**{**debt.__dict__})
-
+                # Copy only the structure being stressed; the model never
+                # mutates its inputs, so the other one is shared as-is.
                 if param in ["usd_mkt_rate", "lkr_rate", "usd_dfi_rate"]:
-                    setattr(sd, param, val)
+                    sp, sd = params, replace(debt, **{param: val})
                 else:
-                    setattr(sp, param, val)
+                    sp, sd = replace(params, **{param: val}), debt
 
-                mr = build_financial_model(sp, sd)
+                mr = build_financial_model(sp, sd, include_annual=False)
 
                 results.append(
                     {
@@ -1,9 +1,17 @@
 # dutchbay_v13/validate.py
 from __future__ import annotations
 import os, sys, json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
-import yaml
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Optional fast JSON decoder; stdlib json is the fallback.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+from .parse_cache import load_cached
 
 def _mode_from_env_or_flag(flag: str | None) -> str:
     if flag in ("strict", "relaxed"):
@@ -11,26 +19,26 @@ def _mode_from_env_or_flag(flag: str | None) -> str:
     env = (os.environ.get("VALIDATION_MODE") or "").lower()
     return env if env in ("strict", "relaxed") else "relaxed"
 
+_REQUIRED_RELAXED = frozenset({"project", "capex"})
+_REQUIRED_STRICT = _REQUIRED_RELAXED | {"metrics"}
+_ALLOWED_STRICT = _REQUIRED_STRICT | {"Financing_Terms", "annual"}
+
 def validate_params_dict(data: Dict[str, Any], *, mode: str = "relaxed") -> None:
     """
     Minimal guardrails:
       - relaxed: require {project, capex}
       - strict : require {project, capex, metrics} and reject unknown top-level keys
     """
-    required_base = {"project", "capex"}
-    required = set(required_base)
-    if mode == "strict":
-        required |= {"metrics"}
+    required = _REQUIRED_STRICT if mode == "strict" else _REQUIRED_RELAXED
 
-    missing = [k for k in required if k not in data]
+    # set differences keep the happy path allocation-free; lists only on error
+    missing = required - data.keys()
     if missing:
-        raise SystemExit(f"missing required keys: {missing}")
+        raise SystemExit(f"missing required keys: {sorted(missing)}")
 
-    if mode == "strict":
-        allowed = required | {"Financing_Terms", "annual"}
-        unknown = [k for k in data.keys() if k not in allowed]
-        if unknown:
-            raise SystemExit(f"unknown top-level keys (strict mode): {unknown}")
+    if mode == "strict" and data.keys() - _ALLOWED_STRICT:
+        unknown = [k for k in data if k not in _ALLOWED_STRICT]
+        raise SystemExit(f"unknown top-level keys (strict mode): {unknown}")
 
     # basic value checks (mode-agnostic)
     capex_total = float(data.get("capex", {}).get("usd_total", 0.0))
@@ -43,6 +51,28 @@ def validate_params_dict(data: Dict[str, Any], *, mode: str = "relaxed") -> None
         if not (0.0 <= dr <= 1.0):
             raise SystemExit("Financing_Terms.debt_ratio must be in [0,1]")
 
+# Inclusive bounds for the V12 ProjectParameters fields Monte Carlo varies
+# per scenario (keys matched case-insensitively).
+PROJECT_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "cf_p50": (0.30, 0.55),
+    "fx_depr": (0.0, 0.10),
+}
+
+def validate_project_parameters(params: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """
+    Bounds-check V12 project parameters (e.g. ProjectParameters.__dict__).
+    Returns (is_valid, errors); absent fields are not checked.
+    """
+    norm = {str(k).lower(): v for k, v in (params or {}).items()}
+    errors: List[str] = []
+    for k, (lo, hi) in PROJECT_BOUNDS.items():
+        v = norm.get(k)
+        if v is None:
+            continue
+        if not (lo <= float(v) <= hi):
+            errors.append(f"{k} outside allowed range [{lo}, {hi}]: {v}")
+    return (not errors, errors)
+
 def validate_debt_dict(data: Dict[str, Any], *, mode: str = "relaxed") -> None:
     ft = data.get("Financing_Terms") or {}
     if mode == "strict" and "debt_ratio" not in ft:
@@ -51,22 +81,47 @@ def validate_debt_dict(data: Dict[str, Any], *, mode: str = "relaxed") -> None:
     if not (0.0 <= dr <= 1.0):
         raise SystemExit("Financing_Terms.debt_ratio must be in [0,1]")
 
+# PyYAML is imported on first parse: importers that only need the bounds
+# checks (e.g. monte_carlo) never pay for it.
+@lru_cache(maxsize=1)
+def _yaml_load():
+    import yaml
+    from .yaml_compat import SafeLoader
+    return lambda stream: yaml.load(stream, Loader=SafeLoader)
+
+def _read_yaml(p: str) -> Any:
+    # hand libyaml the byte stream; no intermediate str copy
+    with open(p, "rb") as fh:
+        return _yaml_load()(fh) or {}
+
+def _read_json(p: str) -> Any:
+    with open(p, "rb") as fh:
+        raw = fh.read() or b"{}"
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 def load_params_from_file(path: Path) -> Dict[str, Any]:
     p = Path(path)
     if p.is_dir():
         # scenario_runner handles directories; keep this function file-only
         raise SystemExit(f"{p} is a directory (expected a file)")
-    text = p.read_text(encoding="utf-8")
-    if p.suffix.lower() in (".yaml", ".yml"):
-        return yaml.safe_load(text) or {}
-    return json.loads(text or "{}")
+    # load_cached hands back a private copy; callers may mutate it
+    read = _read_yaml if p.suffix.lower() in (".yaml", ".yml") else _read_json
+    return load_cached(p, read)
 
 def _iter_input_files(p: Path) -> Iterable[Path]:
     if p.is_file():
         yield p
     elif p.is_dir():
-        for ext in ("*.yaml", "*.yml", "*.json"):
-            yield from sorted(p.rglob(ext))
+        # One walk instead of an rglob per extension; still grouped by
+        # extension, each group sorted, as the per-extension globs were.
+        groups: Dict[str, List[Path]] = {".yaml": [], ".yml": [], ".json": []}
+        for root, dirs, files in os.walk(p):
+            for name in (*dirs, *files):
+                for ext, group in groups.items():
+                    if name.endswith(ext):
+                        group.append(Path(root, name))
+        for group in groups.values():
+            yield from sorted(group)
 
 def _main(argv: List[str] | None = None) -> int:
     import argparse
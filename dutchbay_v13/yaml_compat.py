@@ -0,0 +1,15 @@
+# dutchbay_v13/yaml_compat.py
+"""
+PyYAML loader/dumper selection shared by every module that reads or writes YAML.
+
+Prefers the libyaml-backed classes; falls back to the pure-Python ones when
+PyYAML was built without libyaml.
+"""
+from __future__ import annotations
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper  # type: ignore
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader, SafeDumper  # type: ignore
+
+__all__ = ["SafeLoader", "SafeDumper"]
@@ -7,6 +7,8 @@ import subprocess
 from copy import deepcopy
 import yaml
 
+from dutchbay_v13.yaml_compat import SafeLoader, SafeDumper
+
 TRY_JSON = ["--format", "json"]
 
 SCENARIOS = [
@@ -20,13 +22,13 @@ SCENARIOS = [
 
 
 def _read_yaml(path):
-    with open(path, "r") as f:
-        return yaml.safe_load(f)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def _dump_yaml(d, path):
     with open(path, "w") as f:
-        yaml.safe_dump(d, f, sort_keys=False)
+        yaml.dump(d, f, Dumper=SafeDumper, sort_keys=False)
 
 
 def _apply_overrides(base_cfg: dict, capacity_mw: int, cover: str, tax_holiday: bool):
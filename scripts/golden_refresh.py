@@ -1,5 +1,5 @@
 from __future__ import annotations
-import json, os, subprocess, sys
+import json, os, sys
 from pathlib import Path
 
 SCENARIO = Path("dutchbay_v13/inputs/scenarios/release_case.yaml")
@@ -12,25 +12,18 @@ def main() -> int:
         print(f"[x] Missing scenario: {SCENARIO}", file=sys.stderr)
         return 2
 
+    from dutchbay_v13.scenario_runner import run_dir
+
     OUTDIR.mkdir(parents=True, exist_ok=True)
-    env = os.environ.copy()
-    env["VALIDATION_MODE"] = "relaxed"
-
-    cmd = [
-        sys.executable, "-m", "dutchbay_v13",
-        "--mode", "irr",
-        "--config", str(SCENARIO),
-        "--out", str(OUTDIR),
-        "--fmt", "csv",
-    ]
-    subprocess.run(cmd, check=True, env=env)
+    os.environ["VALIDATION_MODE"] = "relaxed"
+    run_dir(SCENARIO, OUTDIR, mode="irr", fmt="csv")
 
     sj = OUTDIR / "summary.json"
     if not sj.exists():
         print("[x] summary.json not produced; check CLI/run_dir", file=sys.stderr)
         return 3
 
-    data = json.loads(sj.read_text(encoding="utf-8"))
+    data = json.loads(sj.read_bytes())
     # Ensure we only store known keys to keep the baseline slim & stable
     minimal = {k: float(data[k]) for k in FROZEN_KEYS if k in data}
     if set(minimal) != set(FROZEN_KEYS):
@@ -4,6 +4,9 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[2]  # repo root
 IRR = ROOT / "dutchbay_v13" / "finance" / "irr.py"
 
+# One pass per file for either definition.
+IRR_NPV_DEF = re.compile(r"\bdef\s+(?:irr|npv)\s*\(")
+
 EXCLUDE_DIRS = {
     ".venv", "venv", ".venv311", ".git", ".pytest_cache", "build",
     "dist", "__pycache__", ".mypy_cache", ".tox", ".eggs"
@@ -25,6 +28,6 @@ def test_only_irr_module_defines_irr_and_npv():
         if p == IRR:
             continue
         text = p.read_text(encoding="utf-8", errors="ignore")
-        if re.search(r"\bdef\s+irr\s*\(", text) or re.search(r"\bdef\s+npv\s*\(", text):
+        if "def" in text and IRR_NPV_DEF.search(text):
             hits.append(str(p))
     assert not hits, f"Found IRR/NPV defs outside finance/irr.py: {hits}"
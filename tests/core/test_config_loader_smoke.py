@@ -18,3 +18,42 @@ def test_config_loader_smoke(tmp_path):
     except Exception:
         pytest.xfail("config loader present but not stable")
     assert cfg is not None
+
+def test_load_model_config_reuses_parse_but_not_objects(tmp_path):
+    from dutchbay_v13 import config as m
+    from dutchbay_v13.parse_cache import _parse
+    misses = _parse.cache_info().misses
+    yml = tmp_path / "model.yaml"
+    yml.write_text("tariff_lkr_per_kwh: 45.0\ndebt: {debt_ratio: 0.7}\n", encoding="utf-8")
+    flat1, debt1 = m.load_model_config(yml)
+    flat1["tariff_lkr_per_kwh"] = 0.0
+    debt1["debt_ratio"] = 0.0
+    flat2, debt2 = m.load_model_config(yml)
+    assert flat2["tariff_lkr_per_kwh"] == 45.0
+    assert debt2 == {"debt_ratio": 0.7}
+    assert _parse.cache_info().misses == misses + 1
+
+def test_load_config_shares_cache_and_sees_edits(tmp_path):
+    from dutchbay_v13 import config as m
+    from dutchbay_v13.parse_cache import _parse
+    misses = _parse.cache_info().misses
+    yml = tmp_path / "shared.yaml"
+    yml.write_text("tariff_lkr_per_kwh: 45.0\n", encoding="utf-8")
+    assert m.load_config(yml) == {"tariff_lkr_per_kwh": 45.0}
+    assert m.load_model_config(yml)[0] == {"tariff_lkr_per_kwh": 45.0}
+    assert _parse.cache_info().misses == misses + 1
+    yml.write_text("tariff_lkr_per_kwh: 50.25\n", encoding="utf-8")
+    assert m.load_config(yml) == {"tariff_lkr_per_kwh": 50.25}
+
+def test_fallback_parser_coerces_obvious_scalars():
+    from dutchbay_v13.config import _parse_yaml_fallback
+    out = _parse_yaml_fallback("a: 1\nb: -2.5\nc: TRUE\nd: USD\ne: 1e5\n# x: 1\n")
+    assert out == {"a": 1, "b": -2.5, "c": True, "d": "USD", "e": "1e5"}
+
+def test_load_model_config_debt_section_is_always_a_mapping():
+    import io
+    from dutchbay_v13 import config as m
+    flat, debt = m.load_model_config(io.StringIO("tariff_lkr_per_kwh: 45.0\n"))
+    assert debt == {} and flat["tariff_lkr_per_kwh"] == 45.0
+    flat, debt = m.load_model_config(io.StringIO("tariff_lkr_per_kwh: 45.0\ndebt:\n"))
+    assert debt == {} and "debt" not in flat
@@ -0,0 +1,25 @@
+def test_load_params_caches_parse_and_sees_edits(tmp_path):
+    from dutchbay_v13 import params as m
+    yml = tmp_path / "base.yaml"
+    over = tmp_path / "over.yaml"
+    yml.write_text("project: {capacity_mw: 150}\ncapex: {usd_total: 1.0}\n", encoding="utf-8")
+    over.write_text("project: {capacity_mw: 100}\n", encoding="utf-8")
+
+    p1 = m.load_params(yml, over, mode="relaxed")
+    assert p1["project"]["capacity_mw"] == 100
+    p1["capex"]["usd_total"] = -1.0  # mutating a result must not leak into the cache
+    assert m.load_params(yml, mode="relaxed")["capex"]["usd_total"] == 1.0
+
+    yml.write_text("project: {capacity_mw: 150}\ncapex: {usd_total: 22.5}\n", encoding="utf-8")
+    assert m.load_params(yml, mode="relaxed")["capex"]["usd_total"] == 22.5
+
+
+def test_financing_terms_coerces_without_touching_input():
+    from dutchbay_v13 import params as m
+    p = {"Financing_Terms": {"debt_ratio": "0.7", "tenor_years": "15", "amortization": "Level",
+                             "rates": {"usd_floor": "0.08"}, "reserves": {"dsra_months": 6.0}}}
+    ft = m.financing_terms(p)
+    assert ft["debt_ratio"] == 0.7 and ft["tenor_years"] == 15 and ft["amortization"] == "level"
+    assert ft["rates"] == {"usd_floor": 0.08} and ft["reserves"]["dsra_months"] == 6
+    assert ft["mix"] == {} and ft["fees"] == {}
+    assert p["Financing_Terms"]["rates"]["usd_floor"] == "0.08"
@@ -15,3 +15,39 @@ def test_validate_params_smoke():
         fn({"tariff_lkr_per_kwh": 45.0})
     except Exception:
         pytest.xfail("validate present but not stable")
+
+def test_validate_project_parameters_bounds():
+    from dataclasses import asdict
+    from dutchbay_v13.legacy_v12 import create_default_parameters
+    from dutchbay_v13.validate import validate_project_parameters
+    assert validate_project_parameters(asdict(create_default_parameters())) == (True, [])
+    ok, errors = validate_project_parameters({"CF_P50": 0.9, "fx_depr": 0.05, "total_capex": -1.0})
+    assert not ok and len(errors) == 1 and errors[0].startswith("cf_p50 outside allowed range")
+
+def test_load_params_from_file_caches_parse_and_sees_edits(tmp_path):
+    from dutchbay_v13.validate import load_params_from_file
+    yml = tmp_path / "case.yaml"
+    yml.write_text("capex: {usd_total: 1.0}\n", encoding="utf-8")
+    d = load_params_from_file(yml)
+    d["capex"]["usd_total"] = -1.0  # mutating a result must not leak into the cache
+    assert load_params_from_file(yml)["capex"]["usd_total"] == 1.0
+    yml.write_text("capex: {usd_total: 22.5}\n", encoding="utf-8")
+    assert load_params_from_file(yml)["capex"]["usd_total"] == 22.5
+
+def test_iter_input_files_groups_by_extension(tmp_path):
+    from dutchbay_v13.validate import _iter_input_files
+    (tmp_path / "sub").mkdir()
+    for rel in ("b.json", "sub/a.yml", "z.yaml", "sub/c.yaml", "notes.txt"):
+        (tmp_path / rel).write_text("{}", encoding="utf-8")
+    got = [f.relative_to(tmp_path).as_posix() for f in _iter_input_files(tmp_path)]
+    assert got == ["sub/c.yaml", "z.yaml", "sub/a.yml", "b.json"]
+
+def test_parse_cache_is_bounded_and_keyed_on_resolved_path(tmp_path, monkeypatch):
+    from dutchbay_v13.parse_cache import _parse
+    from dutchbay_v13.validate import load_params_from_file
+    assert _parse.cache_info().maxsize == 128
+    (tmp_path / "case.yaml").write_text("a: 1\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    misses = _parse.cache_info().misses
+    assert load_params_from_file("case.yaml") == load_params_from_file(tmp_path / "case.yaml") == {"a": 1}
+    assert _parse.cache_info().misses == misses + 1
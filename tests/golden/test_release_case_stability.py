@@ -1,5 +1,5 @@
 from __future__ import annotations
-import json, os, sys, subprocess
+import json
 from pathlib import Path
 
 SCENARIO = Path("dutchbay_v13/inputs/scenarios/release_case.yaml")
@@ -9,21 +9,15 @@ OUTDIR   = Path("_out_golden_test")
 # Keys we freeze for drift detection
 FROZEN_KEYS = ("equity_irr", "project_irr", "npv_12")
 
-def test_release_case_is_stable():
+def test_release_case_is_stable(monkeypatch):
     assert SCENARIO.exists(), f"Missing scenario {SCENARIO} – add it, or update the path in this test."
 
-    # Run via CLI to exercise the public surface and artifact writing
+    # Run in-process; CLI argv parsing is covered by tests/smoke/test_cli_e2e.py
+    from dutchbay_v13.scenario_runner import run_dir
+
     OUTDIR.mkdir(parents=True, exist_ok=True)
-    env = os.environ.copy()
-    env["VALIDATION_MODE"] = "relaxed"  # Force non-strict for reproducibility
-    cmd = [
-        sys.executable, "-m", "dutchbay_v13",
-        "--mode", "irr",
-        "--config", str(SCENARIO),
-        "--out", str(OUTDIR),
-        "--fmt", "csv",
-    ]
-    subprocess.run(cmd, check=True, env=env)
+    monkeypatch.setenv("VALIDATION_MODE", "relaxed")  # Force non-strict for reproducibility
+    run_dir(SCENARIO, OUTDIR, mode="irr", fmt="csv")
 
     # Artifacts must exist
     sj = OUTDIR / "summary.json"
@@ -38,8 +32,8 @@ def test_release_case_is_stable():
         "and commit tests/golden/summary.json"
     )
 
-    got = json.loads(sj.read_text(encoding="utf-8"))
-    want = json.loads(BASELINE.read_text(encoding="utf-8"))
+    got = json.loads(sj.read_bytes())
+    want = json.loads(BASELINE.read_bytes())
 
     # Compare only frozen keys with a small tolerance
     for k in FROZEN_KEYS:
@@ -4,7 +4,7 @@ import yaml
 
 import pytest
 
-from dutchbay_v13.scenario_runner import run_dir
+from dutchbay_v13.scenario_runner import run_dir, run_matrix
 
 MINIMAL_GOOD = {
     "project": {"capacity_mw": 150, "timeline": {"lifetime_years": 25}},
@@ -33,6 +33,43 @@ def test_run_dir_writes_outputs_csv(tmp_path: Path, monkeypatch):
     annuals = list(outdir.glob("*_annual_*.csv"))
     # allow either (some configs may not emit annuals); no hard assert here
 
+def test_run_dir_writes_outputs_jsonl(tmp_path: Path):
+    import json
+    outdir = tmp_path / "outputs"
+    data = dict(MINIMAL_GOOD, annual=[{"cfads_usd": 1.0e7}] * 25)
+    cfg = _write_yaml(tmp_path, "case.yaml", data)
+    res = run_dir(cfg, outdir, mode="irr", fmt="jsonl", save_annual=True)
+    lines = res.results_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 25
+    assert json.loads(lines[0])["year"] == 1.0
+    summary = json.loads((outdir / "summary.json").read_text(encoding="utf-8"))
+    assert "npv_12" in summary
+    assert "annual" not in summary and len(res.summary["annual"]) == 25
+
+def test_run_dir_placeholder_annual_writes_layout_only(tmp_path: Path):
+    cfg = _write_yaml(tmp_path, "case.yaml", MINIMAL_GOOD)
+    res = run_dir(cfg, tmp_path / "csv", mode="irr", fmt="csv", save_annual=True)
+    # same csv.writer dialect (CRLF) as a populated results file
+    assert res.results_path.read_bytes() == b"cfads_usd,equity_cf,year\r\n"
+    res = run_dir(cfg, tmp_path / "jsonl", mode="irr", fmt="jsonl", save_annual=True)
+    assert res.results_path.read_text(encoding="utf-8") == ""
+
+def test_run_matrix_parallel_matches_serial(tmp_path: Path):
+    import json
+    scen = tmp_path / "scen"
+    scen.mkdir()
+    for i, cf in enumerate((8.0e6, 1.0e7, 1.2e7)):
+        _write_yaml(scen, f"s{i}.yaml", dict(MINIMAL_GOOD, annual=[{"cfads_usd": cf}] * 25))
+    serial = run_matrix(scen, tmp_path / "a", workers=1)
+    parallel = run_matrix(scen, tmp_path / "b", workers=2)
+    assert list(parallel) == list(serial) == ["s0.yaml", "s1.yaml", "s2.yaml"]
+    assert [r.summary for r in parallel.values()] == [r.summary for r in serial.values()]
+    last = json.loads((tmp_path / "b" / "summary.json").read_text(encoding="utf-8"))
+    assert last == serial["s2.yaml"].summary
+    # pool workers skip the shared summary write; only the parent writes it
+    res = run_dir(scen / "s0.yaml", tmp_path / "c", write_summary=False)
+    assert not res.summary_path.exists()
+
 def test_strict_rejects_unknown_key(tmp_path: Path, monkeypatch):
     bad = dict(MINIMAL_GOOD)
     bad["unknown_key"] = 1
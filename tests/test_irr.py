@@ -10,3 +10,22 @@ def test_irr_simple():
 def test_npv_zero_rate():
     cf = [-100.0, 30.0, 40.0, 50.0]
     assert abs(npv(0.0, cf) - sum(cf)) < 1e-9
+
+
+def test_irr_newton_matches_closed_form_and_handles_nonconventional():
+    # two-period closed form: -100 + 110/(1+r) = 0 -> r = 10%
+    assert abs(irr([-100.0, 110.0]) - 0.10) < 1e-12
+    # multiple sign changes skip Newton and still return a root
+    cf = [-100.0, 230.0, -132.0]
+    r = irr(cf)
+    assert r is not None and abs(npv(r, cf)) < 1e-6
+    # no sign change -> no IRR
+    assert irr([1.0, 2.0]) is None
+
+
+def test_irr_local_bracketed_newton_agrees_with_newton():
+    from dutchbay_v13.finance.irr import _irr_local, _irr_newton
+    cf = [-1500.0] + [180.0] * 20
+    r = _irr_local(cf)
+    assert r is not None and abs(r - _irr_newton(cf)) < 1e-10
+    assert _irr_local([-100.0, -5.0]) is None